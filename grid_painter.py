@@ -1,7 +1,6 @@
 import numpy as np
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
 
 
 class PaintGridDialog(QDialog):
@@ -14,10 +13,15 @@ class PaintGridDialog(QDialog):
         self.nx = nx
         self.ny = ny
         self.magmatic_area = np.zeros((nx, ny), dtype=int)  # Default: No magmatic body
+        self.last_cell = None  # Cell painted by the previous sample of the current stroke
 
         self.initUI()
 
     def initUI(self):
+        # matplotlib is only needed once the dialog is built.
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+
         layout = QVBoxLayout(self)
 
         info_label = QLabel("Click on the grid to paint the magmatic body. Use the clear button to reset.")
@@ -40,6 +44,20 @@ class PaintGridDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+        # The axes and the painted-cell image are built once; painting only
+        # updates the image and blits it over the cached background.
+        self.ax = self.figure.add_subplot(111)
+        self.background = None
+        self.setup_axes()
+        self.canvas.mpl_connect("draw_event", self.on_draw)
+
+        # Mouse moves arrive far faster than the screen refreshes; cells are
+        # marked immediately but redrawn at most once per frame (~16 ms).
+        self.paint_timer = QTimer(self)
+        self.paint_timer.setSingleShot(True)
+        self.paint_timer.setInterval(16)
+        self.paint_timer.timeout.connect(self.blit_cells)
+
         # Draw the initial grid
         self.plot_grid()
 
@@ -47,10 +65,9 @@ class PaintGridDialog(QDialog):
         self.canvas.mpl_connect("motion_notify_event", self.on_drag)
         self.canvas.mpl_connect("button_press_event", self.on_click)
 
-    def plot_grid(self):
-        """Draw the grid and painted cells."""
-        ax = self.figure.add_subplot(111)
-        ax.clear()
+    def setup_axes(self):
+        """Create the grid decorations and the image holding the painted cells."""
+        ax = self.ax
 
         # Draw grid lines
         ax.set_xticks(np.arange(0, self.nx, max(1, self.nx // 10)))
@@ -61,8 +78,11 @@ class PaintGridDialog(QDialog):
         ax.set_yticks(np.arange(-0.5, self.ny, 1), minor=True)
         ax.grid(which="minor", color="gray", linestyle="-", linewidth=0.5)
 
-        # Highlight painted cells
-        ax.imshow(self.magmatic_area, cmap="Reds", origin="upper", extent=(-0.5, self.nx - 0.5, -0.5, self.ny - 0.5))
+        # Highlight painted cells. The image is animated, so full redraws leave
+        # it out of the cached background and draw_cells() paints it on top.
+        self.image = ax.imshow(self.magmatic_area, cmap="Reds", origin="upper",
+                               extent=(-0.5, self.nx - 0.5, -0.5, self.ny - 0.5),
+                               vmin=0, vmax=1, animated=True)
 
         # Set limits and aspect ratio
         ax.set_xlim(-0.5, self.nx - 0.5)
@@ -71,29 +91,80 @@ class PaintGridDialog(QDialog):
         ax.set_xlabel("Grid X")
         ax.set_ylabel("Grid Y")
 
-        self.canvas.draw()
+    def plot_grid(self):
+        """
+        Request a redraw of the whole canvas: grid and painted cells.
+
+        The draw is deferred to the next idle pass of the event loop, and
+        on_draw refreshes the blit background once it has happened.
+        """
+        self.image.set_data(self.magmatic_area)
+        self.canvas.draw_idle()
+
+    def on_draw(self, event):
+        """After a full redraw, cache the background and paint the cells over it."""
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.draw_cells()
+
+    def draw_cells(self):
+        """Draw the painted cells, then the grid lines and frame that sit above them."""
+        self.ax.draw_artist(self.image)
+        for tick in self.ax.xaxis.get_minor_ticks() + self.ax.yaxis.get_minor_ticks():
+            self.ax.draw_artist(tick.gridline)
+        for spine in self.ax.spines.values():
+            self.ax.draw_artist(spine)
+
+    def blit_cells(self):
+        """Refresh only the painted cells on top of the cached background."""
+        if self.background is None:
+            self.plot_grid()
+            return
+        self.image.set_data(self.magmatic_area)
+        self.canvas.restore_region(self.background)
+        self.draw_cells()
+        self.canvas.blit(self.ax.bbox)
 
     def on_click(self, event):
         """Handle mouse clicks on the grid."""
         if event.inaxes is not None:
+            self.last_cell = None  # A click starts a new stroke
             self.toggle_cell(event)
 
     def on_drag(self, event):
         """Handle mouse drag events to paint multiple cells."""
-        if event.inaxes is not None and event.button == 1:  # Left button drag
+        if event.inaxes is None:
+            self.last_cell = None  # Do not bridge a stroke that left the grid
+        elif event.button == 1:  # Left button drag
             self.toggle_cell(event)
 
     def toggle_cell(self, event):
-        """Toggle the state of a cell on the grid."""
+        """
+        Paint the cell under the cursor and schedule a redraw if anything changed.
+
+        Fast drags deliver sparse samples, so the straight run of cells from the
+        previous sample of the stroke is painted as well.
+        """
         ix, iy = int(np.floor(event.xdata + 0.5)), int(np.floor(event.ydata + 0.5))
-        if 0 <= ix < self.nx and 0 <= iy < self.ny:
-            self.magmatic_area[iy, ix] = 1
-            self.plot_grid()
+        if self.last_cell is None:
+            xs, ys = np.array([ix]), np.array([iy])
+        else:
+            x0, y0 = self.last_cell
+            n = max(abs(ix - x0), abs(iy - y0)) + 1
+            xs = np.linspace(x0, ix, n).round().astype(int)
+            ys = np.linspace(y0, iy, n).round().astype(int)
+        self.last_cell = (ix, iy)
+
+        inside = (xs >= 0) & (xs < self.nx) & (ys >= 0) & (ys < self.ny)
+        xs, ys = xs[inside], ys[inside]
+        if not self.magmatic_area[ys, xs].all():
+            self.magmatic_area[ys, xs] = 1
+            if not self.paint_timer.isActive():
+                self.paint_timer.start()
 
     def clear_paint(self):
         """Clear all painted cells."""
         self.magmatic_area.fill(0)
-        self.plot_grid()
+        self.blit_cells()
 
     def get_magmatic_area(self):
         """Return the painted magmatic area."""
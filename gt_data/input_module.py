@@ -1,17 +1,105 @@
+import logging
+from functools import lru_cache
+
 from PyQt5.QtWidgets import (
     QDialog, QFormLayout, QLabel, QLineEdit, QPushButton, QComboBox, 
     QInputDialog, QMessageBox, QCheckBox
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QDoubleValidator, QRegularExpressionValidator
+from PyQt5.QtCore import Qt, QTimer, QLocale, QRegularExpression, QSettings
 from gt_data.data_manager import data_manager  
 
-class GeometrySelectionDialog(QDialog):
-    def __init__(self):
+log = logging.getLogger(__name__)
+
+# One or more non-negative numbers (plain decimal or scientific notation)
+# separated by semicolons, with an optional trailing semicolon.
+_TIME_PATTERN = (r"\s*(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+                 r"(?:\s*;\s*(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)*\s*;?\s*")
+
+
+@lru_cache(maxsize=None)
+def _number_validator():
+    """
+    Returns a validator accepting plain decimal or scientific numbers with '.'
+    as decimal point, regardless of the system locale. Invalid characters are
+    rejected by Qt as they are typed. A single instance is shared by every
+    numeric field of every dialog.
+    """
+    validator = QDoubleValidator()
+    locale = QLocale.c()
+    locale.setNumberOptions(QLocale.RejectGroupSeparator)
+    validator.setLocale(locale)
+    validator.setNotation(QDoubleValidator.ScientificNotation)
+    return validator
+
+
+def _restore_geometry(dialog, default):
+    """
+    Restores the dialog geometry saved by _save_geometry, falling back to the
+    given (x, y, width, height) the first time the dialog is opened.
+    """
+    geometry = QSettings("GeoTherm", "gt_data").value(type(dialog).__name__ + "/geometry")
+    if not geometry or not dialog.restoreGeometry(geometry):
+        dialog.setGeometry(*default)
+
+
+def _save_geometry(dialog):
+    """Stores the dialog geometry so the next instance reopens with the same size and position."""
+    if dialog.isVisible():
+        QSettings("GeoTherm", "gt_data").setValue(type(dialog).__name__ + "/geometry",
+                                                  dialog.saveGeometry())
+
+
+class _InputDialog(QDialog):
+    """
+    Shared behaviour of the input dialogs: the window geometry is remembered
+    between openings, and validation (_do_check_inputs, provided by each
+    dialog) is deferred until typing pauses.
+    """
+    def __init__(self, default_geometry):
         super().__init__()
+        _restore_geometry(self, default_geometry)
+
+        # Validation is deferred and restarted on every edit, so a burst of
+        # keystrokes is checked once instead of once per character.
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(100)
+        self._validate_timer.timeout.connect(self._do_check_inputs)
+
+    def check_inputs(self):
+        """
+        Schedules validation of the fields; repeated calls within the timer
+        interval collapse into a single pass.
+        """
+        self._validate_timer.start()
+
+    def accept(self):
+        """
+        Runs any pending validation before accepting, so a stale OK state
+        (e.g. Enter pressed right after clearing a field) cannot accept an
+        invalid form.
+        """
+        self._validate_timer.stop()
+        self._do_check_inputs()
+        if self.ok_button.isEnabled():
+            super().accept()
+
+    def done(self, result):
+        """Remembers the dialog geometry whenever it is accepted or rejected."""
+        _save_geometry(self)
+        super().done(result)
+
+
+class GeometrySelectionDialog(_InputDialog):
+    def __init__(self):
+        super().__init__((100, 100, 400, 200))
         self.setWindowTitle("Select Geometry and Parameters")
-        self.setGeometry(100, 100, 400, 200)
         self.layout = QFormLayout()
 
+        # Set while on_id_changed fills the form, which then validates once.
+        self._suppress_check = False
+
         # Create an editable QComboBox for IDs.
         self.id_input = QComboBox()
         self.id_input.setEditable(True)
@@ -20,7 +108,10 @@ class GeometrySelectionDialog(QDialog):
         self.id_input.addItems(data_manager.get_ids())
         # Initially, the field is empty.
         self.id_input.setCurrentText("")
-        self.id_input.currentTextChanged.connect(self.on_id_changed)
+        # Stored data is loaded when an ID is picked from the list or the typed
+        # ID is committed, not on every keystroke.
+        self.id_input.textActivated.connect(self.on_id_changed)
+        self.id_input.lineEdit().editingFinished.connect(self.on_id_changed_finished)
         self.id_input.lineEdit().textEdited.connect(self.on_text_edited)
 
         self.geometry_input = QComboBox()
@@ -29,6 +120,7 @@ class GeometrySelectionDialog(QDialog):
 
         self.d_label = QLabel()
         self.d_input = QLineEdit()
+        self.d_input.setValidator(_number_validator())
         self.d_input.textChanged.connect(self.check_inputs)
 
         self.layout.addRow("Select or Enter ID:", self.id_input)
@@ -69,21 +161,40 @@ class GeometrySelectionDialog(QDialog):
         """
         if selected_id == "":
             return
-        if selected_id == "<NEW ID>":
-            self.id_input.setEditText("")
-            self.id_input.setToolTip("Please enter a new ID here.")
-            self.d_input.clear()
-        else:
-            self.id_input.setToolTip("")
-            data = data_manager.get_data(selected_id)
-            if data:
-                geometry = data.get("geometry", "")
-                d = data.get("d", "")
-                self.geometry_input.setCurrentText(geometry)
-                self.d_input.setText(str(d))
-                self.update_d_visibility()
+        self._suppress_check = True
+        try:
+            if selected_id == "<NEW ID>":
+                self.id_input.setEditText("")
+                self.id_input.setToolTip("Please enter a new ID here.")
+                self.d_input.clear()
+            else:
+                self.id_input.setToolTip("")
+                data = data_manager.get_data(selected_id)
+                if data:
+                    geometry = data.get("geometry", "")
+                    d = data.get("d", "")
+                    self.geometry_input.setCurrentText(geometry)
+                    self.d_input.blockSignals(True)
+                    self.d_input.setText(str(d))
+                    self.d_input.blockSignals(False)
+                    self.update_d_visibility()
+        finally:
+            self._suppress_check = False
         self.check_inputs()
 
+    def on_id_changed_finished(self):
+        """
+        Loads the stored data for a typed ID once editing is finished.
+        editingFinished also fires whenever focus leaves the field, so this
+        only reloads when the user actually edited the ID; otherwise changes
+        made to 'd' or the geometry would be overwritten.
+        """
+        line_edit = self.id_input.lineEdit()
+        if not line_edit.isModified():
+            return
+        line_edit.setModified(False)
+        self.on_id_changed(self.id_input.currentText())
+
     def on_text_edited(self, text):
         """
         When the user edits the ID field, if the text is "<NEW ID>",
@@ -93,6 +204,7 @@ class GeometrySelectionDialog(QDialog):
             self.id_input.setToolTip("Please clear '<NEW ID>' to enter a new ID.")
         else:
             self.id_input.setToolTip("")
+        self.check_inputs()
 
     def update_d_visibility(self):
         """
@@ -112,6 +224,15 @@ class GeometrySelectionDialog(QDialog):
         self.check_inputs()
 
     def check_inputs(self):
+        """
+        Schedules validation of the ID and 'd' fields, unless on_id_changed
+        is filling the form and will validate once itself.
+        """
+        if self._suppress_check:
+            return
+        super().check_inputs()
+
+    def _do_check_inputs(self):
         """
         Validates that the ID field is not empty or equal to "<NEW ID>" 
         and that 'd' is a valid number greater than zero.
@@ -121,20 +242,10 @@ class GeometrySelectionDialog(QDialog):
         d_text = self.d_input.text().strip()
 
         is_id_valid = (id_text != "" and id_text != "<NEW ID>")
-        is_d_valid = self.is_valid_number(d_text) and float(d_text) > 0
+        is_d_valid = self.d_input.hasAcceptableInput() and float(d_text) > 0
 
         self.ok_button.setEnabled(is_id_valid and is_d_valid)
 
-    def is_valid_number(self, text):
-        """
-        Returns True if the given text can be converted to a float.
-        """
-        try:
-            float(text)
-            return True
-        except ValueError:
-            return False
-
     def get_geometry_and_d(self):
         """
         Returns the selected geometry, the 'd' value, and the ID.
@@ -158,11 +269,10 @@ class GeometrySelectionDialog(QDialog):
             return geometry, d, selected_id
 
 
-class ParameterInputDialog(QDialog):
+class ParameterInputDialog(_InputDialog):
     def __init__(self, geometry):
-        super().__init__()
+        super().__init__((100, 100, 400, 500))
         self.setWindowTitle("Enter Parameters")
-        self.setGeometry(100, 100, 400, 500)
         layout = QFormLayout()
         self.geometry = geometry
 
@@ -176,6 +286,11 @@ class ParameterInputDialog(QDialog):
         self.time_input = QLineEdit()
         # Default value for times
         self.time_input.setText("1;10;100;1000;10000;100000;1000000;5000000;10000000")
+        for input_field in (self.T0_input, self.K1_input, self.k_input, self.K_input,
+                            self.k1_input, self.g_input, self.l_input):
+            input_field.setValidator(_number_validator())
+        self.time_input.setValidator(
+            QRegularExpressionValidator(QRegularExpression(_TIME_PATTERN), self))
 
         self.inputs = [
             self.T0_input,
@@ -206,41 +321,58 @@ class ParameterInputDialog(QDialog):
         self.auto_plot_checkbox.toggled.connect(self.toggle_plot_config_fields)
         layout.addRow(self.auto_plot_checkbox)
 
+        # The custom plot configuration fields are only needed when auto-plot
+        # is disabled, so they are built on first use (see build_plot_config_fields).
+        self.form_layout = layout
+        self.x_custom_label = self.x_custom_input = None
+        self.Tmin_label = self.Tmin_input = None
+        self.Tmax_label = self.Tmax_input = None
+        if not auto_plot_default:
+            self.build_plot_config_fields()
+
+        self.ok_button = QPushButton("OK")
+        self.ok_button.clicked.connect(self.accept)
+        self.ok_button.setEnabled(False)
+        layout.addWidget(self.ok_button)
+
+        self.setLayout(layout)
+
+        # Numeric fields currently taking part in validation. Kept up to date
+        # by toggle_plot_config_fields, so check_inputs never has to query
+        # widget visibility.
+        self._numeric_inputs = self.numeric_inputs_for(auto_plot_default)
+        # Last parsed time list as (text, times, all_nonzero); see parse_times.
+        self._time_cache = (None, None, False)
+
+        # Connect signals for validation.
+        for input_field in self.inputs:
+            input_field.textChanged.connect(self.check_inputs)
+
+    def build_plot_config_fields(self):
+        """
+        Creates the custom plot configuration fields right below the auto-plot
+        checkbox and connects them for validation.
+        """
+        row, _ = self.form_layout.getWidgetPosition(self.auto_plot_checkbox)
+
         # Create custom plot configuration fields with descriptive labels.
         self.x_custom_label = QLabel("Distance to mid-intrusion (plot half-range):")
         self.x_custom_input = QLineEdit()
         self.x_custom_input.setPlaceholderText("Enter distance for plot x-axis")
-        layout.addRow(self.x_custom_label, self.x_custom_input)
+        self.form_layout.insertRow(row + 1, self.x_custom_label, self.x_custom_input)
 
         self.Tmin_label = QLabel("Minimum temperature (plot y-axis):")
         self.Tmin_input = QLineEdit()
         self.Tmin_input.setPlaceholderText("Enter minimum temperature for plot")
-        layout.addRow(self.Tmin_label, self.Tmin_input)
+        self.form_layout.insertRow(row + 2, self.Tmin_label, self.Tmin_input)
 
         self.Tmax_label = QLabel("Maximum temperature (plot y-axis):")
         self.Tmax_input = QLineEdit()
         self.Tmax_input.setPlaceholderText("Enter maximum temperature for plot")
-        layout.addRow(self.Tmax_label, self.Tmax_input)
-
-        # Se o default auto_plot for True, os campos customizados são ocultos.
-        if auto_plot_default:
-            self.x_custom_label.hide()
-            self.x_custom_input.hide()
-            self.Tmin_label.hide()
-            self.Tmin_input.hide()
-            self.Tmax_label.hide()
-            self.Tmax_input.hide()
-
-        self.ok_button = QPushButton("OK")
-        self.ok_button.clicked.connect(self.accept)
-        self.ok_button.setEnabled(False)
-        layout.addWidget(self.ok_button)
-
-        self.setLayout(layout)
+        for input_field in (self.x_custom_input, self.Tmin_input, self.Tmax_input):
+            input_field.setValidator(_number_validator())
+        self.form_layout.insertRow(row + 3, self.Tmax_label, self.Tmax_input)
 
-        # Connect signals for validation.
-        for input_field in self.inputs:
-            input_field.textChanged.connect(self.check_inputs)
         self.x_custom_input.textChanged.connect(self.check_inputs)
         self.Tmin_input.textChanged.connect(self.check_inputs)
         self.Tmax_input.textChanged.connect(self.check_inputs)
@@ -249,34 +381,56 @@ class ParameterInputDialog(QDialog):
         """
         Shows or hides the custom plot configuration fields based on the checkbox state.
         """
-        if checked:  # Auto-plot enabled: hide custom fields.
+        if not checked and self.x_custom_input is None:
+            self.build_plot_config_fields()
+        if checked and self.x_custom_input is not None:  # Auto-plot enabled: hide custom fields.
             self.x_custom_label.hide()
             self.x_custom_input.hide()
             self.Tmin_label.hide()
             self.Tmin_input.hide()
             self.Tmax_label.hide()
             self.Tmax_input.hide()
-        else:  # Auto-plot disabled: show custom fields.
+        elif not checked:  # Auto-plot disabled: show custom fields.
             self.x_custom_label.show()
             self.x_custom_input.show()
             self.Tmin_label.show()
             self.Tmin_input.show()
             self.Tmax_label.show()
             self.Tmax_input.show()
+        self._numeric_inputs = self.numeric_inputs_for(checked)
+
+        def value_of(input_field):
+            text = input_field.text() if input_field is not None else ""
+            return float(text) if text else None
+
         try:
             data_manager.set_plot_defaults({
-                "auto_plot": self.auto_plot_checkbox.isChecked(),
-                "x_custom": float(self.x_custom_input.text()) if self.x_custom_input.text() else None,
-                "Tmin": float(self.Tmin_input.text()) if self.Tmin_input.text() else None,
-                "Tmax": float(self.Tmax_input.text()) if self.Tmax_input.text() else None
+                "auto_plot": checked,
+                "x_custom": value_of(self.x_custom_input),
+                "Tmin": value_of(self.Tmin_input),
+                "Tmax": value_of(self.Tmax_input)
             })
         except ValueError:
             pass
 
         self.check_inputs()
 
+    def numeric_inputs_for(self, auto_plot):
+        """
+        Returns the numeric fields to validate: the model parameters, plus the
+        custom plot fields when auto-plot is disabled.
+        """
+        numeric_inputs = tuple(self.inputs[:-1])
+        if not auto_plot:
+            numeric_inputs += (self.x_custom_input, self.Tmin_input, self.Tmax_input)
+        return numeric_inputs
+
     def set_parameters(self, parameters):
         """Fills the fields with stored parameters and loads plot defaults from DataManager."""
+        # Block textChanged while filling the fields; validation runs once at the end.
+        fields = [w for w in self.inputs + [self.x_custom_input, self.Tmin_input, self.Tmax_input] if w is not None]
+        for w in fields:
+            w.blockSignals(True)
         self.T0_input.setText(str(parameters.get("T0", "")))
         self.K1_input.setText(str(parameters.get("K1", "")))
         self.k_input.setText(str(parameters.get("k", "")))
@@ -288,7 +442,7 @@ class ParameterInputDialog(QDialog):
         
         # Load plot defaults from DataManager (ignoring any plot-related keys in 'parameters')
         plot_defaults = data_manager.get_plot_defaults()
-        print("DEBUG: Loaded plot_defaults from DataManager:", plot_defaults)  # Debug print
+        log.debug("Loaded plot_defaults from DataManager: %s", plot_defaults)
         auto_plot_default = plot_defaults.get("auto_plot", True)
         self.auto_plot_checkbox.setChecked(auto_plot_default)
         if not auto_plot_default:
@@ -296,54 +450,50 @@ class ParameterInputDialog(QDialog):
             x_custom = plot_defaults.get("x_custom", "")
             Tmin = plot_defaults.get("Tmin", "")
             Tmax = plot_defaults.get("Tmax", "")
-            print("DEBUG: Setting custom plot fields: x_custom =", x_custom, "Tmin =", Tmin, "Tmax =", Tmax)  # Debug
+            log.debug("Setting custom plot fields: x_custom = %s Tmin = %s Tmax = %s", x_custom, Tmin, Tmax)
             self.x_custom_input.setText(str(x_custom) if x_custom is not None else "")
             self.Tmin_input.setText(str(Tmin) if Tmin is not None else "")
             self.Tmax_input.setText(str(Tmax) if Tmax is not None else "")
-        else:
+        elif self.x_custom_input is not None:
             # Se auto-plot estiver ativado, limpa os campos customizados.
             self.x_custom_input.setText("")
             self.Tmin_input.setText("")
             self.Tmax_input.setText("")
+        for w in fields:
+            w.blockSignals(False)
         self.toggle_plot_config_fields(self.auto_plot_checkbox.isChecked())
 
-    def check_inputs(self):
+    def _do_check_inputs(self):
         """
         Validates that all visible fields are filled and contain valid numbers.
         """
-        all_filled = all(input_field.text().strip() for input_field in self.inputs if input_field.isVisible())
-        all_valid = all(self.is_valid_number(input_field.text()) for input_field in self.inputs[:-1] if input_field.isVisible())
+        # The validators reject empty or malformed numbers, so only the
+        # non-zero time condition is left to check in Python.
+        # One short-circuiting pass: stops at the first invalid field and only
+        # parses the time list when every numeric field is acceptable.
+        ok = (all(input_field.hasAcceptableInput() for input_field in self._numeric_inputs)
+              and self.parse_times()[1])
 
-        time_text = self.time_input.text()
-        time_values = [t.strip() for t in time_text.split(';') if t.strip()]
-        try:
-            all_times_valid = all(float(t) != 0 for t in time_values)
-        except ValueError:
-            all_times_valid = False
-
-        if not self.auto_plot_checkbox.isChecked():
-            extra_filled = (self.x_custom_input.text().strip() != "" and 
-                            self.Tmin_input.text().strip() != "" and 
-                            self.Tmax_input.text().strip() != "")
-            extra_valid = (self.is_valid_number(self.x_custom_input.text()) and
-                           self.is_valid_number(self.Tmin_input.text()) and
-                           self.is_valid_number(self.Tmax_input.text()))
-        else:
-            extra_filled = True
-            extra_valid = True
+        self.ok_button.setEnabled(ok)
 
-        self.ok_button.setEnabled(all_filled and all_valid and all_times_valid and extra_filled and extra_valid)
-
-    def is_valid_number(self, text):
-        try:
-            float(text)
-            return True
-        except ValueError:
-            return False
+    def parse_times(self):
+        """
+        Returns (times, all_nonzero) for the current time field. The result is
+        cached on the raw text, so validation passes triggered by other fields
+        do not split and convert the time list again.
+        """
+        time_text = self.time_input.text()
+        if time_text != self._time_cache[0]:
+            if self.time_input.hasAcceptableInput():
+                times = tuple(float(t) for t in time_text.split(';') if t.strip())
+                self._time_cache = (time_text, times, all(t != 0 for t in times))
+            else:
+                self._time_cache = (time_text, (), False)
+        return self._time_cache[1], self._time_cache[2]
 
     def get_parameters(self):
         """Returns the parameters entered by the user."""
-        times = [float(t.strip()) for t in self.time_input.text().split(';') if t.strip()]
+        times = list(self.parse_times()[0])
         parameters = {
             "geometry": self.geometry,
             "T0": float(self.T0_input.text()),
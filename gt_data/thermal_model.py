@@ -1,9 +1,53 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from math import sqrt, pi, exp
-from scipy.special import jn_zeros, j0, j1, erf  # Use vectorized erf from scipy.special
+from math import sqrt, pi
+from scipy.special import erf  # Vectorized erf from scipy.special
+
+_SQRT_PI = sqrt(pi)
+
+def _spheric_psi(epsilon, tau):
+    """
+    Dimensionless temperature ψ(ε,τ) around a sphere (Jaeger, 1964), evaluated
+    over the whole ε array at once.
+
+    Parameters:
+        epsilon : array of dimensionless distances ε = x/d; at ε = 0 the
+                  finite limit erf(1/2√τ) - e^(-1/4τ)/√(πτ) is used
+        tau     : dimensionless time τ = κt/d², either a scalar or a column
+                  of shape (n_times, 1) to get one row of ψ per time
+    """
+    # Shared subexpressions: 2√τ, 1/(2√τ), 1/(4τ) and ε ± 1.
+    s = 2 * np.sqrt(tau)
+    inv_s = 1 / s
+    inv_4tau = 0.25 / tau
+    ep1 = epsilon + 1
+    em1 = epsilon - 1
+    # 1/ε with the centre masked out instead of dividing by zero.
+    at_centre = epsilon == 0
+    inv_eps = np.divide(1.0, epsilon, out=np.zeros_like(epsilon, dtype=float), where=~at_centre)
+    # ψ = ½[erf((ε+1)/2√τ) - erf((ε-1)/2√τ) - 2√τ/(ε√π)·(e^(-(ε-1)²/4τ) - e^(-(ε+1)²/4τ))],
+    # accumulated in place to avoid a temporary array per operator.
+    Psi = erf(ep1 * inv_s)
+    Psi -= erf(em1 * inv_s)
+    gauss = np.exp(-(em1 * em1) * inv_4tau)
+    gauss -= np.exp(-(ep1 * ep1) * inv_4tau)
+    gauss *= s * inv_eps / _SQRT_PI
+    Psi -= gauss
+    Psi *= 0.5
+    if at_centre.any():
+        Psi[..., at_centre] = erf(inv_s) - np.exp(-inv_4tau) / (0.5 * _SQRT_PI * s)
+    return Psi
+
 
 class ThermalModel:
+    # Analytical solver for each geometry. 'Plug-like body' is interpreted as
+    # a cylindrical intrusion, so both names share run_plug.
+    _ANALYTICAL = {
+        "Tabular-like body": "run_tabular",
+        "Spheric-like body": "run_spheric",
+        "Plug-like body": "run_plug",
+        "Cylindrical-like body": "run_plug",
+    }
+
     def run(self, data, geometry, T0, K1, k, K, k1, g, l, d=None, time=None):
         """
         Main entry point for running the thermal model.
@@ -25,20 +69,15 @@ class ThermalModel:
         method = data.get("method", "analytical")  # Default to analytical
         if method == "numerical":
             return self.run_numerical(data, T0, K1, k, K, k1, g, l)
-        elif geometry == "Tabular-like body":
-            return self.run_tabular(data, T0, K1, k, K, k1, g, l)
-        elif geometry == "Spheric-like body":
-            return self.run_spheric(data, T0, K1, k, K, k1, g, l, d, time)
-        elif geometry == "Cylindrical-like body" or geometry == "Plug-like body":
-            # Here, 'Plug-like body' is interpreted as a cylindrical intrusion.
-            return self.run_plug(data, T0, K1, k, K, k1, g, l, d, time)
-        else:
+        solver = self._ANALYTICAL.get(geometry)
+        if solver is None:
             raise ValueError("Unknown geometry specified.")
+        return getattr(self, solver)(data, T0, K1, k, K, k1, g, l, d, time)
 
     # ========================
     # ANALYTICAL SOLUTION
     # ========================
-    def run_tabular(self, data, T0, K1, k, K, k1, g, l):
+    def run_tabular(self, data, T0, K1, k, K, k1, g, l, d=None, time=None):
         """
         Analytical solution for an infinite sheet (tabular body):
         
@@ -50,12 +89,14 @@ class ThermalModel:
           - k is the thermal diffusivity (κ),
           - t is time, and
           - x is the spatial coordinate.
+
+        'd' and 'time' are taken from the data dictionary when not given.
         """
-        # Retrieve 'd' and 'time' from the data dictionary
-        d_value = data.get("d", None)
+        d_value = d if d is not None else data.get("d", None)
         if d_value is None:
             raise ValueError("Parameter 'd' is required for Tabular-like body.")
-        time = data.get("time", None)
+        if time is None:
+            time = data.get("time", None)
         if time is None:
             raise ValueError("Parameter 'time' (list of times) is required for Tabular-like body.")
         
@@ -115,33 +156,26 @@ class ThermalModel:
         Tecx = g * l
 
         results = {}
-        for t in time:
-            # Choose spatial grid based on auto_plot configuration.
-            if not data.get("auto_plot", True):
-                x_custom = data.get("x_custom", None)
-                if x_custom is None:
-                    raise ValueError("Custom x value must be provided when auto_plot is disabled.")
-                x_values = np.linspace(-x_custom, x_custom, 1000)
-            else:
-                x_values = np.linspace(-2 * d, 2 * d, 1000)
-            
-            # Compute dimensionless spatial coordinate ε = x/d
-            epsilon = x_values / d
-            # Compute dimensionless time τ = (κ * t) / d²
-            tau = (k * t) / (d ** 2)
-            
-            # Calculate ψ(ξ,τ) using the expression from Jaeger (1964)
-            Psi = [
-                0.5 * (
-                    erf((eps + 1) / (2 * sqrt(tau))) -
-                    erf((eps - 1) / (2 * sqrt(tau))) -
-                    (2 * sqrt(tau) / (eps * sqrt(pi))) *
-                    (exp(-((eps - 1) ** 2) / (4 * tau)) - exp(-((eps + 1) ** 2) / (4 * tau)))
-                )
-                for eps in epsilon
-            ]
-            
-            T_profile = [(T0 - Tecx) * psi + Tecx for psi in Psi]
+        # Choose spatial grid based on auto_plot configuration.
+        if not data.get("auto_plot", True):
+            x_custom = data.get("x_custom", None)
+            if x_custom is None:
+                raise ValueError("Custom x value must be provided when auto_plot is disabled.")
+            x_values = np.linspace(-x_custom, x_custom, 1000)
+        else:
+            x_values = np.linspace(-2 * d, 2 * d, 1000)
+
+        # Compute dimensionless spatial coordinate ε = x/d
+        epsilon = x_values / d
+
+        # Compute dimensionless time τ = (κ * t) / d² for all times as a
+        # column, so ψ(ξ,τ) (Jaeger, 1964) is evaluated for every time in a
+        # single (n_times, n_x) pass; row i belongs to time[i].
+        tau = (k * np.asarray(time, dtype=float) / (d ** 2))[:, np.newaxis]
+        Psi_all = _spheric_psi(epsilon, tau)
+
+        for t, Psi in zip(time, Psi_all):
+            T_profile = (T0 - Tecx) * Psi + Tecx
             
             # In manual mode, clip the temperature profile between Tmin and Tmax.
             if not data.get("auto_plot", True):
@@ -204,23 +238,30 @@ class ThermalModel:
             x_custom = data.get("x_custom", None)
             if x_custom is None:
                 raise ValueError("Custom x value must be provided when auto_plot is disabled.")
-            x_values = np.linspace(-x_custom, x_custom, 1000)
-            y_values = np.linspace(-x_custom, x_custom, 1000)
+            x_values = np.linspace(-x_custom, x_custom, 1000, dtype=np.float32)
+            y_values = np.linspace(-x_custom, x_custom, 1000, dtype=np.float32)
         else:
-            x_values = np.linspace(-3*d1, 3*d1, 1000)
-            y_values = np.linspace(-3*d2, 3*d2, 1000)
+            x_values = np.linspace(-3*d1, 3*d1, 1000, dtype=np.float32)
+            y_values = np.linspace(-3*d2, 3*d2, 1000, dtype=np.float32)
+        # The 1000x1000 grids and temperature fields are plot data only, so
+        # they are kept in float32 to halve their memory footprint.
         X, Y = np.meshgrid(x_values, y_values)
+        # φ(ξ₁,τ₁) only varies along x and φ(ξ₂,τ₂) only along y, so both are
+        # evaluated on the 1D axes and combined with an outer product.
+        xi1 = x_values / d1
+        xi2 = y_values / d2
         
         for t in time:
             tau1 = k * t / (d1**2)
             tau2 = k * t / (d2**2)
-            xi1 = X / d1
-            xi2 = Y / d2
 
-            phi1 = 0.5 * (erf((xi1 + 1) / (2 * np.sqrt(tau1))) - erf((xi1 - 1) / (2 * np.sqrt(tau1))))
-            phi2 = 0.5 * (erf((xi2 + 1) / (2 * np.sqrt(tau2))) - erf((xi2 - 1) / (2 * np.sqrt(tau2))))
+            inv_s1 = 0.5 / sqrt(tau1)  # 1/(2√τ₁)
+            inv_s2 = 0.5 / sqrt(tau2)  # 1/(2√τ₂)
+
+            phi1 = 0.5 * (erf((xi1 + 1) * inv_s1) - erf((xi1 - 1) * inv_s1))
+            phi2 = 0.5 * (erf((xi2 + 1) * inv_s2) - erf((xi2 - 1) * inv_s2))
             
-            T_profile = (T0 - Tecx) * phi1 * phi2 + Tecx
+            T_profile = (T0 - Tecx) * np.multiply.outer(phi2, phi1) + Tecx
             
             # In manual mode, clip the temperature distribution between Tmin and Tmax.
             if not data.get("auto_plot", True):
@@ -256,21 +297,25 @@ class ThermalModel:
         return {"x": xv, "y": yv}
 
     def assemble_fem_system(self, grid, parameters, T0, K1, k, K, k1, g, l):
-        """Assembles the stiffness matrix and load vector for the FEM."""
+        """
+        Assembles the stiffness matrix and load vector for the FEM.
+
+        The stiffness matrix is a sparse CSC matrix, so memory grows with the
+        number of nonzeros rather than with (nx*ny)².
+        """
+        from scipy.sparse import identity
         nx, ny = grid["x"].shape
-        matrix = np.zeros((nx * ny, nx * ny))  # Stiffness matrix
-        rhs = np.zeros(nx * ny)  # Load vector
+        n = nx * ny
+        rhs = np.full(n, T0, dtype=float)  # Load vector: constant heat source T0
 
-        # Simple example: fill the diagonal and set a constant heat source T0
-        for i in range(nx * ny):
-            matrix[i, i] = 1
-            rhs[i] = T0
+        # Simple example: identity stiffness matrix
+        matrix = identity(n, format="csc")
 
         return matrix, rhs
 
     def solve_system(self, matrix, rhs):
         """Solves the linear system Ax = b."""
         from scipy.sparse.linalg import spsolve
-        solution = np.linalg.solve(matrix, rhs)  # Using dense solver for simplicity
+        solution = spsolve(matrix, rhs)
         size = int(sqrt(len(rhs)))
         return solution.reshape((size, size))
@@ -1,10 +1,10 @@
 import os
 import time
 import numpy as np
-import matplotlib.pyplot as plt
 from io import BytesIO
 
-import win32com.client  # For COM automation if needed (not used in PDF saving)
+# matplotlib is imported inside the methods that draw, so opening the main
+# window does not pay for it until a plot is actually requested.
 from PyQt5.QtCore import pyqtSignal, Qt, QBuffer, QIODevice
 from PyQt5.QtGui import QImage, QPixmap
 from PyQt5.QtWidgets import (
@@ -12,6 +12,10 @@ from PyQt5.QtWidgets import (
     QGridLayout, QMessageBox, QInputDialog
 )
 
+# Largest number of samples per axis handed to contourf; denser 2D results are
+# strided down to this before contouring.
+MAX_CONTOUR_POINTS = 250
+
 class ClickableLabel(QLabel):
     """
     QLabel subclass that emits a signal when clicked.
@@ -68,6 +72,9 @@ class Visualization(QDialog):
 
         # List to store plots (up to 9).
         self.stored_plots = []
+        # Rendered thumbnails, keyed by stored figure, reused across preview refreshes.
+        self.thumbnail_cache = {}
+        self.placeholder_figure = None
         self.grid_rows = 3  # Default rows for grid preview
         self.grid_cols = 3  # Default columns for grid preview
 
@@ -140,6 +147,8 @@ class Visualization(QDialog):
         In manual mode (auto_plot disabled), the x-axis and y-axis limits (or the color scale for 2D plots)
         are fixed according to the user's configuration.
         """
+        import matplotlib.pyplot as plt
+
         if self.results is None:
             return
 
@@ -178,7 +187,11 @@ class Visualization(QDialog):
             axes = np.array(axes).flatten()
             for i, (t, (X, Y, T)) in enumerate(self.results.items()):
                 ax = axes[i]
-                cp = ax.contourf(X, Y, T, levels=20, cmap="viridis")
+                # Contouring cost grows with the grid size while the smooth
+                # profiles look the same at screen resolution, so large grids
+                # are decimated for display.
+                step = max(1, int(np.ceil(max(T.shape) / MAX_CONTOUR_POINTS)))
+                cp = ax.contourf(X[::step, ::step], Y[::step, ::step], T[::step, ::step], levels=20, cmap="viridis")
                 fig.colorbar(cp, ax=ax)
                 ax.set_title(f"Time = {t} years")
                 ax.set_xlabel("x (m)")
@@ -208,6 +221,8 @@ class Visualization(QDialog):
 
         A file dialog opens so that the user can choose where to save the PDF.
         """
+        import matplotlib.pyplot as plt
+
         if self.results is None:
             print("No results to save.")
             return
@@ -252,15 +267,24 @@ class Visualization(QDialog):
 
     def create_placeholder(self):
         """
-        Creates a placeholder figure to indicate an empty slot.
+        Returns the placeholder figure used to indicate an empty slot.
+
+        The figure is built on first use and reused afterwards, so its
+        thumbnail is rendered only once.
 
         Returns:
             matplotlib.figure.Figure: A placeholder figure.
         """
-        fig, ax = plt.subplots(figsize=(4, 4))
-        ax.text(0.5, 0.5, "Placeholder", fontsize=12, ha="center", va="center", color="gray")
-        ax.axis("off")
-        return fig
+        from matplotlib.figure import Figure
+
+        if self.placeholder_figure is None:
+            # Built outside pyplot so the figure is freed with the dialog.
+            fig = Figure(figsize=(4, 4))
+            ax = fig.add_subplot(111)
+            ax.text(0.5, 0.5, "Placeholder", fontsize=12, ha="center", va="center", color="gray")
+            ax.axis("off")
+            self.placeholder_figure = fig
+        return self.placeholder_figure
 
     def is_placeholder(self, fig):
         """
@@ -300,6 +324,8 @@ class Visualization(QDialog):
         Automatically manages the placeholder so that it is only present when exactly one real plot is stored.
         Updates the store button text and preview grid.
         """
+        from matplotlib.figure import Figure
+
         if self.results is None:
             QMessageBox.warning(self, "No Results", "No results to store.")
             return
@@ -310,7 +336,10 @@ class Visualization(QDialog):
             QMessageBox.warning(self, "Limit Reached", f"Maximum number of plots ({max_slots}) reached.")
             return
 
-        fig, ax = plt.subplots(figsize=(4, 4))
+        # Stored figures are not registered with pyplot, so deleting a slot or
+        # clearing the grid actually releases their memory.
+        fig = Figure(figsize=(4, 4))
+        ax = fig.add_subplot(111)
         sample = next(iter(self.results.values()))
         if len(sample) == 2:
             for t, (x, T) in self.results.items():
@@ -322,7 +351,7 @@ class Visualization(QDialog):
         else:
             ax.text(0.5, 0.5, "2D Plot", fontsize=12, ha="center", va="center")
             ax.axis("off")
-        plt.tight_layout()
+        fig.tight_layout()
 
         self.stored_plots.append(fig)
         self.manage_placeholder()
@@ -357,8 +386,13 @@ class Visualization(QDialog):
             if widget:
                 widget.deleteLater()
 
+        # Only figures that were not rendered before need a trip through Agg.
+        self.thumbnail_cache = {
+            fig: self.thumbnail_cache[fig] if fig in self.thumbnail_cache else figure_to_pixmap(fig)
+            for fig in self.stored_plots
+        }
         for index, fig in enumerate(self.stored_plots):
-            pixmap = figure_to_pixmap(fig)
+            pixmap = self.thumbnail_cache[fig]
             label = ClickableLabel(index)
             label.setPixmap(pixmap)
             label.setScaledContents(True)
@@ -370,6 +404,8 @@ class Visualization(QDialog):
         Called when a thumbnail is clicked in the preview grid.
         Prompts the user to view or delete the stored plot.
         """
+        import matplotlib.pyplot as plt
+
         msg_box = QMessageBox(self)
         msg_box.setWindowTitle("Slot Options")
         msg_box.setText(f"Do you want to view or delete the plot in slot {index + 1}?")
@@ -408,6 +444,8 @@ class Visualization(QDialog):
         """
         Saves all stored plots in a grid layout as a single PDF file.
         """
+        import matplotlib.pyplot as plt
+
         if not self.stored_plots:
             QMessageBox.warning(self, "No Plots", "No plots to save.")
             return
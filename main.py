@@ -361,15 +361,9 @@ class MainWindow(QMainWindow):
         self.visualize_button.setEnabled(False)
         self.visualize_button.setStyleSheet("font-size: 18px; padding: 10px; color: gray;")
         self.clear_button.setVisible(False)
-        self.input_button.setEnabled(False)
 
-        self.status_label.setText("Clearing data input...")
-        QApplication.processEvents()
-        QTimer.singleShot(1000, self._clear_inputs_done)
-
-    def _clear_inputs_done(self):
+        # Clearing is instantaneous; only the confirmation message is timed.
         self.status_label.setText("Data input cleared")
-        self.input_button.setEnabled(True)
         QTimer.singleShot(1000, lambda: self.status_label.setText(""))
 
     def visualizeResults(self):